@@ -1,17 +1,112 @@
 import docker
 import asyncio
+import codecs
 from docker.errors import DockerException, APIError
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Callable, Optional, Set, Tuple
 import os
-from datetime import datetime
-import iso8601
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import attrgetter
+import threading
 import time
 import logging
 
 # Set up logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logging.basicConfig(
+    level=getattr(logging, os.environ.get("DOCKMAN_LOG", "WARNING").upper(), logging.WARNING),
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
 logger = logging.getLogger(__name__)
 
+TableRow = Tuple[str, Tuple[str, ...]]  # (row key, display cells in column order)
+
+_POOL_SIZE = 64  # Docker connections kept alive, and workers to drive them
+_INV_MIB = 1.0 / (1024 * 1024)  # Multiply bytes by this to get MB
+_EMPTY_STATS = {"cpu": 0.0, "memory": 0.0, "memory_percent": 0.0}
+# cgroup v2 locations for the systemd and cgroupfs drivers
+_CGROUP_PATTERNS = ("/sys/fs/cgroup/system.slice/docker-{}.scope", "/sys/fs/cgroup/docker/{}")
+_EVENT_BUCKETS = {"container": "containers", "image": "images", "volume": "volumes", "network": "networks"}
+
+
+def _read_sysfs(path: str) -> bytes:
+    """Read a small pseudo-file in one syscall."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=4096)
+def _format_iso_datetime(datetime_str: str) -> str:
+    """Parse ISO 8601 datetime string to readable format, memoized across refreshes."""
+    if isinstance(datetime_str, str) and len(datetime_str) >= 19 and datetime_str[10] == "T":
+        # Docker emits fixed-layout RFC 3339; the date and wall-clock time are just slices
+        return f"{datetime_str[:10]} {datetime_str[11:19]}"
+    try:
+        # C parser; since Python 3.11 it accepts Docker's "Z" suffix and nanoseconds
+        dt = datetime.fromisoformat(datetime_str)
+    except ValueError:
+        try:
+            import iso8601  # Rarely needed, so kept off the startup path
+            dt = iso8601.parse_date(datetime_str)
+        except Exception:
+            return "Unknown"
+    except TypeError:
+        return "Unknown"
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+@lru_cache(maxsize=2048)
+def _format_ports_cached(ports: Tuple[Tuple[int, int, str], ...]) -> str:
+    """Format sorted (private, public or 0, type) port tuples; a container's ports rarely change."""
+    return ", ".join(
+        f"{public_port}:{private_port}/{port_type}" if public_port else f"{private_port}/{port_type}"
+        for private_port, public_port, port_type in ports
+    )
+
+
+@dataclass(slots=True)
+class ContainerRow:
+    """A container as listed in the Containers tab; display fields are pre-rendered strings."""
+    id: str
+    name: str
+    status: str
+    image: str
+    ports: str
+    cpu: str
+    memory: str
+    memory_percent: str
+    created: str
+    labels: Dict[str, str]
+
+
+@dataclass(slots=True)
+class ImageRow:
+    """A Docker image."""
+    id: str
+    tags: str
+    size: str
+    created: str
+
+
+@dataclass(slots=True)
+class VolumeRow:
+    """A Docker volume."""
+    name: str
+    driver: str
+    mountpoint: str
+    created: str
+
+
+@dataclass(slots=True)
+class NetworkRow:
+    """A Docker network."""
+    id: str
+    name: str
+    driver: str
+    created: str
+
+
 class DockerClient:
     def __init__(self):
         """Initialize Docker client."""
@@ -23,260 +118,526 @@ class DockerClient:
                     "Permission denied for Docker socket. "
                     "Try running with sudo or add user to 'docker' group: sudo usermod -aG docker $USER"
                 )
-            self.client = docker.from_env()
+            # One pooled connection per stats stream plus headroom for regular calls;
+            # docker-py's default of 10 would churn connections past that
+            self.client = docker.from_env(max_pool_size=_POOL_SIZE)
+            # Own workers for blocking API calls, so concurrent refreshes don't queue
+            # on the small default executor shared with the rest of the app
+            self._executor = ThreadPoolExecutor(max_workers=_POOL_SIZE, thread_name_prefix="docker-api")
             self._cache = {
-                "containers": {"data": [], "last_update": 0},
-                "images": {"data": [], "last_update": 0},
-                "volumes": {"data": [], "last_update": 0},
-                "networks": {"data": [], "last_update": 0}
+                "containers": {"data": [], "last_update": 0, "latency": 0.0, "generation": 0},
+                "images": {"data": [], "last_update": 0, "latency": 0.0, "generation": 0},
+                "volumes": {"data": [], "last_update": 0, "latency": 0.0, "generation": 0},
+                "networks": {"data": [], "last_update": 0, "latency": 0.0, "generation": 0}
             }
-            self._container_stats_cache = {}
-            self._cache_duration = 5  # Cache data for 5 seconds
+            self._locks = {key: asyncio.Lock() for key in self._cache}  # Single-flight per bucket
+            # The daemon answers list calls from one socket queue; piling more than a couple on it
+            # when events, tab switches and the timers coincide slows every call down
+            self._fetch_sem = asyncio.Semaphore(2)
+            self._table_rows_cache: Dict[str, Tuple[List[Any], Tuple[str, ...], List[TableRow]]] = {}
+            self._stats_streams: Dict[str, threading.Event] = {}  # Stop flags of stats readers
+            self._stats_lock = threading.Lock()  # Guards _stats_streams across refreshes and readers
+            self._stats_latest: Dict[str, Dict[str, float]] = {}
+            self._image_tags: Dict[str, str] = {}  # Image id -> first tag
+            self._cgroup_paths: Dict[str, Optional[str]] = {}
+            self._cgroup_samples: Dict[str, Tuple[int, float]] = {}  # (usage_usec, monotonic time)
+            self._cpu_count = os.cpu_count() or 1
+            self._host_memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+            self._cache_duration = 5  # Cache data for at least 5 seconds
+            self._events_cache_duration = 60  # Safety TTL while the events stream is live
+            self._events_active = False
+            self._events_stream = None
+            self._event_queues: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+            self._closed = False
+            threading.Thread(target=self._watch_events, name="docker-events", daemon=True).start()
             logger.debug("DockerClient initialized successfully")
         except DockerException as e:
-            logger.error(f"Failed to connect to Docker: {e}")
+            logger.error("Failed to connect to Docker: %s", e)
             raise Exception(f"Failed to connect to Docker: {e}")
 
-    async def get_containers(self, all: bool = True) -> List[Dict[str, Any]]:
-        """Get list of containers with details."""
-        current_time = time.time()
-        if current_time - self._cache["containers"]["last_update"] < self._cache_duration:
-            logger.debug("Returning cached containers")
-            return self._cache["containers"]["data"]
+    async def get_containers(self, all: bool = True, filters: Optional[Dict[str, Any]] = None) -> List[ContainerRow]:
+        """Get list of containers with details, optionally filtered by the daemon."""
+        if all and not filters:
+            return await self._cached("containers", self._list_containers, self._container_row)
+        # Only the full listing is cached; narrower queries go straight to the daemon
+        try:
+            containers = await self._run(self._list_containers, all, filters, False)
+            return [self._container_row(c) for c in containers]
+        except APIError as e:
+            logger.error("Error fetching containers: %s", e)
+            raise Exception(f"Error fetching containers: {e}")
+
+    def _list_containers(
+        self, all: bool = True, filters: Optional[Dict[str, Any]] = None, prune: bool = True
+    ) -> List[Dict[str, Any]]:
+        """List raw containers and refresh their stats. Blocking."""
+        # Raw listing carries every row field; containers.list() would inspect each one
+        containers = self.client.api.containers(all=all, filters=filters)
+        missing = {c["ImageID"] for c in containers} - self._image_tags.keys()
+        if missing:
+            self._list_images()  # One listing resolves every container's image tag
+            # Images deleted from under their containers: don't relist for them every refresh
+            self._image_tags.update(dict.fromkeys(missing - self._image_tags.keys(), "unknown"))
+        self._update_stats_cache(containers, prune=prune)
+        return containers
 
+    def _container_row(self, c: Dict[str, Any]) -> ContainerRow:
+        """Build a container row from a raw listing entry and its latest stats."""
+        stats = self._stats_latest.get(c["Id"], _EMPTY_STATS)
+        return ContainerRow(
+            id=c["Id"][:12],
+            name=c["Names"][0].lstrip("/") if c["Names"] else c["Id"][:12],
+            status=c["State"],
+            image=self._image_tags.get(c["ImageID"], "unknown"),
+            ports=self._format_ports(c["Ports"]),
+            cpu=str(stats["cpu"]),
+            memory=str(stats["memory"]),
+            memory_percent=str(stats["memory_percent"]),
+            created=self._format_timestamp(c["Created"]),
+            labels=c["Labels"] or {}
+        )
+
+    async def list_container_names(
+        self, all: bool = True, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[str, str, str]]:
+        """Get (id, name, status) of containers without stats or formatting work."""
         try:
-            containers = await asyncio.to_thread(self.client.containers.list, all=all)
-            await self._update_stats_cache(containers)
-            self._cache["containers"]["data"] = [
-                {
-                    "id": c.id[:12],
-                    "name": c.name,
-                    "status": c.status,
-                    "image": c.image.tags[0] if c.image.tags else "unknown",
-                    "ports": self._format_ports(c.attrs["NetworkSettings"]["Ports"]),
-                    "cpu": self._container_stats_cache.get(c.id, {"cpu": 0.0})["cpu"],
-                    "memory": self._container_stats_cache.get(c.id, {"memory": 0.0})["memory"],
-                    "memory_percent": self._container_stats_cache.get(c.id, {"memory_percent": 0.0})["memory_percent"],
-                    "created": self._format_datetime(c.attrs["Created"]),
-                    "labels": c.attrs["Config"]["Labels"]
-                }
+            containers = await self._run(self.client.api.containers, all=all, filters=filters)
+            return [
+                (c["Id"][:12], c["Names"][0].lstrip("/") if c["Names"] else c["Id"][:12], c["State"])
                 for c in containers
             ]
-            self._cache["containers"]["last_update"] = current_time
-            logger.debug(f"Fetched {len(containers)} containers")
-            return self._cache["containers"]["data"]
         except APIError as e:
-            logger.error(f"Error fetching containers: {e}")
+            logger.error("Error fetching containers: %s", e)
             raise Exception(f"Error fetching containers: {e}")
 
-    async def _update_stats_cache(self, containers: List) -> None:
-        """Update cached container statistics."""
-        for container in containers:
+    async def get_container_details(self, container_id: str) -> Dict[str, Any]:
+        """Get full inspect data for a single container."""
+        try:
+            return await self._run(self.client.api.inspect_container, container_id)
+        except APIError as e:
+            logger.error("Error inspecting container %s: %s", container_id, e)
+            raise Exception(f"Error inspecting container {container_id}: {e}")
+
+    async def aclose(self) -> None:
+        """Stop background readers and release pooled Docker connections."""
+        self._closed = True
+        with self._stats_lock:
+            for stop in self._stats_streams.values():
+                stop.set()
+            self._stats_streams.clear()
+        if self._events_stream is not None:
+            self._events_stream.close()  # Unblocks the events thread
+        await self._run(self.client.close)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug("DockerClient closed")
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking docker-py call on the client's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def _cached(self, key: str, fetch: Callable[[], List[Any]], build: Callable[[Any], Any]) -> List[Any]:
+        """Return a cache bucket, refetching it once for all concurrent callers when stale."""
+        if self._is_fresh(key, time.time()):
+            logger.debug("Returning cached %s", key)
+            return self._cache[key]["data"]
+
+        async with self._locks[key]:
+            # Another caller may have refreshed the bucket while we waited
+            current_time = time.time()
+            if self._is_fresh(key, current_time):
+                return self._cache[key]["data"]
+
+            generation = self._cache[key]["generation"]
             try:
-                stats = await asyncio.to_thread(container.stats, stream=False)
-                cpu_delta = (
-                    stats["cpu_stats"]["cpu_usage"]["total_usage"]
-                    - stats["precpu_stats"]["cpu_usage"]["total_usage"]
-                )
-                system_delta = (
-                    stats["cpu_stats"]["system_cpu_usage"]
-                    - stats["precpu_stats"]["system_cpu_usage"]
-                )
-                cpu_percent = (cpu_delta / system_delta * 100) if system_delta > 0 else 0.0
-                memory_usage = stats["memory_stats"]["usage"] / (1024 * 1024)  # MB
-                memory_limit = stats["memory_stats"].get("limit", 1) / (1024 * 1024)
-                memory_percent = (memory_usage / memory_limit * 100) if memory_limit > 0 else 0.0
-                self._container_stats_cache[container.id] = {
-                    "cpu": round(cpu_percent, 2),
-                    "memory": round(memory_usage, 2),
-                    "memory_percent": round(memory_percent, 2)
-                }
+                async with self._fetch_sem:  # Only misses wait here; cache hits returned above
+                    started = time.perf_counter()
+                    data = await self._run(fetch)
+                rows = [build(item) for item in data]
+                # Unchanged data keeps its list object, so callers can skip re-rendering
+                if rows != self._cache[key]["data"]:
+                    self._cache[key]["data"] = rows
+                # An invalidation that landed mid-fetch may postdate this data; stay stale then
+                if self._cache[key]["generation"] == generation:
+                    self._cache[key]["last_update"] = current_time
+                self._cache[key]["latency"] = time.perf_counter() - started
+                logger.debug("Fetched %d %s", len(data), key)
+                return self._cache[key]["data"]
+            except APIError as e:
+                logger.error("Error fetching %s: %s", key, e)
+                raise Exception(f"Error fetching {key}: {e}")
+
+    def _is_fresh(self, key: str, current_time: float) -> bool:
+        """Check cache freshness; slow endpoints get a proportionally longer TTL."""
+        entry = self._cache[key]
+        ttl = max(self._cache_duration, 2 * entry["latency"])
+        if self._events_active and key != "containers":
+            # Changes arrive as events; container rows still carry live stats
+            ttl = max(ttl, self._events_cache_duration)
+        return current_time - entry["last_update"] < ttl
+
+    def _invalidate(self, key: str) -> None:
+        """Mark a cache bucket as stale so the next read refetches it."""
+        self._cache[key]["last_update"] = 0
+        self._cache[key]["generation"] += 1
+
+    def _watch_events(self) -> None:
+        """Invalidate cache buckets as the Docker daemon reports changes, reconnecting on failure."""
+        delay = 1.0
+        reconnect = False
+        while not self._closed:
+            try:
+                events = self._events_stream = self.client.events(decode=True, filters={"type": list(_EVENT_BUCKETS)})
+                if self._closed:
+                    events.close()  # aclose() ran while we were connecting
+                    break
+                self._events_active = True
+                logger.debug("Subscribed to Docker events")
+                if reconnect:
+                    # Changes made while the stream was down were never reported
+                    for key in self._cache:
+                        self._publish_change(key)
+                reconnect = True
+                delay = 1.0
+                for event in events:
+                    if event.get("Action", "").startswith("exec_"):
+                        continue  # Exec and health checks don't change any listing
+                    key = _EVENT_BUCKETS.get(event.get("Type"))
+                    if key:
+                        self._publish_change(key)
+                        logger.debug("Invalidated %s cache on %s event", key, event.get('Action'))
             except Exception as e:
-                logger.warning(f"Failed to fetch stats for container {container.id}: {e}")
-                self._container_stats_cache[container.id] = {
-                    "cpu": 0.0,
-                    "memory": 0.0,
-                    "memory_percent": 0.0
-                }
+                if not self._closed:
+                    logger.warning("Docker events stream failed: %s", e)
+            finally:
+                self._events_active = False
+            if not self._closed:
+                time.sleep(delay)  # The daemon may be restarting; back off up to 30s
+                delay = min(delay * 2, 30.0)
+
+    def _publish_change(self, key: str) -> None:
+        """Invalidate a cache bucket and tell event subscribers about it. Events thread only."""
+        if key == "images":
+            self._image_tags = {}  # Tags may have moved; containers re-resolve them
+        self._invalidate(key)
+        for loop, queue in list(self._event_queues):
+            loop.call_soon_threadsafe(queue.put_nowait, key)
+
+    async def events(self) -> AsyncIterator[Set[str]]:
+        """Yield the cache keys ("containers", "images", ...) invalidated since the last batch."""
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue())
+        self._event_queues.append(subscriber)
+        queue = subscriber[1]
+        try:
+            while True:
+                keys = {await queue.get()}
+                # A burst (e.g. compose up: create, connect, start...) becomes one batch
+                while not queue.empty():
+                    keys.add(queue.get_nowait())
+                yield keys
+        finally:
+            self._event_queues.remove(subscriber)
+
+    def _update_stats_cache(self, containers: List[Dict[str, Any]], prune: bool = True) -> None:
+        """Refresh stats of running containers, from cgroup files or stats streams.
+
+        With prune, containers missing from the listing (or no longer running)
+        have their stats dropped; pass False for filtered listings.
+        """
+        running = {c["Id"] for c in containers if c["State"] == "running"}
+        if prune:
+            with self._stats_lock:
+                for container_id in [cid for cid in self._stats_streams if cid not in running]:
+                    self._stats_streams.pop(container_id).set()
+            for cache in (self._stats_latest, self._cgroup_paths, self._cgroup_samples):
+                # Snapshot keys: stats readers insert from their own threads
+                for container_id in [cid for cid in list(cache) if cid not in running]:
+                    cache.pop(container_id, None)
+
+        now = time.monotonic()
+        for container_id in running:
+            if self._read_cgroup_stats(container_id, now):
+                continue
+            with self._stats_lock:
+                # Filtered listings refresh stats without the bucket lock; spawn one reader only
+                if container_id in self._stats_streams:
+                    continue
+                # No cgroup v2 files visible (Docker Desktop, cgroup v1): use the API
+                stop = threading.Event()
+                self._stats_streams[container_id] = stop
+            threading.Thread(
+                target=self._stream_container_stats,
+                args=(container_id, stop),
+                name=f"stats-{container_id[:12]}",
+                daemon=True
+            ).start()
+
+    def _cgroup_path(self, container_id: str) -> Optional[str]:
+        """Locate a container's cgroup v2 directory, caching the result."""
+        if container_id not in self._cgroup_paths:
+            self._cgroup_paths[container_id] = next(
+                (
+                    path for path in (pattern.format(container_id) for pattern in _CGROUP_PATTERNS)
+                    if os.path.isfile(os.path.join(path, "cpu.stat"))
+                ),
+                None
+            )
+        return self._cgroup_paths[container_id]
+
+    def _read_cgroup_stats(self, container_id: str, now: float) -> bool:
+        """Read container CPU and memory usage from sysfs. Return False if unavailable."""
+        path = self._cgroup_path(container_id)
+        if path is None:
+            return False
+        try:
+            cpu_stat = _read_sysfs(os.path.join(path, "cpu.stat"))
+            usage_usec = int(cpu_stat.split(b"usage_usec ", 1)[1].split(b"\n", 1)[0])
+            memory_current = int(_read_sysfs(os.path.join(path, "memory.current")))
+            memory_max = _read_sysfs(os.path.join(path, "memory.max")).strip()
+        except (OSError, IndexError, ValueError) as e:
+            logger.debug("Cannot read cgroup stats for container %s: %s", container_id, e)
+            self._cgroup_paths[container_id] = None
+            return False
+
+        previous = self._cgroup_samples.get(container_id)
+        self._cgroup_samples[container_id] = (usage_usec, now)
+        cpu_percent = 0.0
+        if previous and now > previous[1]:
+            # Share of the whole host, as with the API's system_cpu_usage delta
+            cpu_percent = (usage_usec - previous[0]) / ((now - previous[1]) * 1e6 * self._cpu_count) * 100
+        memory_limit = self._host_memory if memory_max == b"max" else int(memory_max)
+        memory_usage = memory_current * _INV_MIB  # MB
+        memory_percent = (memory_current / memory_limit * 100) if memory_limit > 0 else 0.0
+        self._stats_latest[container_id] = {
+            "cpu": round(cpu_percent, 2),
+            "memory": round(memory_usage, 2),
+            "memory_percent": round(memory_percent, 2)
+        }
+        return True
+
+    def _stream_container_stats(self, container_id: str, stop: threading.Event) -> None:
+        """Consume a container's stats stream, keeping only the latest sample."""
+        try:
+            for stats in self.client.api.stats(container_id, stream=True, decode=True):
+                if stop.is_set():
+                    break
+                try:
+                    self._stats_latest[container_id] = self._parse_stats(stats)
+                except (KeyError, TypeError, ZeroDivisionError):
+                    continue  # First sample has no precpu_stats yet
+        except Exception as e:
+            logger.warning("Stats stream for container %s failed: %s", container_id, e)
+        finally:
+            with self._stats_lock:
+                if self._stats_streams.get(container_id) is stop:  # Not a reader started since
+                    self._stats_streams.pop(container_id, None)
+            logger.debug("Stats stream for container %s closed", container_id)
+
+    def _parse_stats(self, stats: Dict) -> Dict[str, float]:
+        """Compute CPU and memory usage from a raw stats sample."""
+        cpu_delta = (
+            stats["cpu_stats"]["cpu_usage"]["total_usage"]
+            - stats["precpu_stats"]["cpu_usage"]["total_usage"]
+        )
+        system_delta = (
+            stats["cpu_stats"]["system_cpu_usage"]
+            - stats["precpu_stats"]["system_cpu_usage"]
+        )
+        cpu_percent = (cpu_delta / system_delta * 100) if system_delta > 0 else 0.0
+        memory_bytes = stats["memory_stats"]["usage"]
+        memory_limit = stats["memory_stats"].get("limit", 1)
+        memory_usage = memory_bytes * _INV_MIB  # MB
+        memory_percent = (memory_bytes / memory_limit * 100) if memory_limit > 0 else 0.0
+        return {
+            "cpu": round(cpu_percent, 2),
+            "memory": round(memory_usage, 2),
+            "memory_percent": round(memory_percent, 2)
+        }
 
     def _format_datetime(self, datetime_str: str) -> str:
         """Parse ISO 8601 datetime string to readable format."""
+        return _format_iso_datetime(datetime_str)
+
+    def _format_timestamp(self, timestamp: int) -> str:
+        """Format a Unix timestamp (UTC) to readable format."""
         try:
-            dt = iso8601.parse_date(datetime_str)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
+            return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
         except Exception:
             return "Unknown"
 
-    def _format_ports(self, ports: Dict) -> str:
+    def _format_ports(self, ports: List[Dict]) -> str:
         """Format container ports into a readable string."""
         if not ports:
             return ""
-        result = []
-        for private_port, public_ports in ports.items():
-            if public_ports:
-                for public_port in public_ports:
-                    result.append(f"{public_port['HostPort']}:{private_port}")
-            else:
-                result.append(f"{private_port}")
-        return ", ".join(result)
+        # The daemon lists ports in map order, which changes between calls; sort for a stable cell
+        return _format_ports_cached(
+            tuple(sorted((port["PrivatePort"], port.get("PublicPort") or 0, port["Type"]) for port in ports))
+        )
 
     async def start_container(self, container_id: str) -> None:
         """Start a container by ID."""
         try:
-            container = await asyncio.to_thread(self.client.containers.get, container_id)
-            await asyncio.to_thread(container.start)
-            self._cache["containers"]["last_update"] = 0  # Invalidate cache
-            logger.debug(f"Started container {container_id}")
+            await self._run(self.client.api.start, container_id)
+            self._invalidate("containers")
+            logger.debug("Started container %s", container_id)
         except APIError as e:
-            logger.error(f"Error starting container {container_id}: {e}")
+            logger.error("Error starting container %s: %s", container_id, e)
             raise Exception(f"Error starting container {container_id}: {e}")
 
     async def stop_container(self, container_id: str, timeout: int = 10) -> None:
         """Stop a container by ID."""
         try:
-            container = await asyncio.to_thread(self.client.containers.get, container_id)
-            await asyncio.to_thread(container.stop, timeout=timeout)
-            self._cache["containers"]["last_update"] = 0  # Invalidate cache
-            logger.debug(f"Stopped container {container_id}")
+            await self._run(self.client.api.stop, container_id, timeout=timeout)
+            self._invalidate("containers")
+            logger.debug("Stopped container %s", container_id)
         except APIError as e:
-            logger.error(f"Error stopping container {container_id}: {e}")
+            logger.error("Error stopping container %s: %s", container_id, e)
             raise Exception(f"Error stopping container {container_id}: {e}")
 
     async def restart_container(self, container_id: str, timeout: int = 10) -> None:
         """Restart a container by ID."""
         try:
-            container = await asyncio.to_thread(self.client.containers.get, container_id)
-            await asyncio.to_thread(container.restart, timeout=timeout)
-            self._cache["containers"]["last_update"] = 0  # Invalidate cache
-            logger.debug(f"Restarted container {container_id}")
+            await self._run(self.client.api.restart, container_id, timeout=timeout)
+            self._invalidate("containers")
+            logger.debug("Restarted container %s", container_id)
         except APIError as e:
-            logger.error(f"Error restarting container {container_id}: {e}")
+            logger.error("Error restarting container %s: %s", container_id, e)
             raise Exception(f"Error restarting container {container_id}: {e}")
 
     async def remove_container(self, container_id: str, force: bool = False) -> None:
         """Remove a container by ID."""
         try:
-            container = await asyncio.to_thread(self.client.containers.get, container_id)
-            await asyncio.to_thread(container.remove, force=force)
-            self._cache["containers"]["last_update"] = 0  # Invalidate cache
-            logger.debug(f"Removed container {container_id}")
+            await self._run(self.client.api.remove_container, container_id, force=force)
+            self._invalidate("containers")
+            logger.debug("Removed container %s", container_id)
         except APIError as e:
-            logger.error(f"Error removing container {container_id}: {e}")
+            logger.error("Error removing container %s: %s", container_id, e)
             raise Exception(f"Error removing container {container_id}: {e}")
 
     async def get_container_logs(self, container_id: str, tail: int = 100) -> str:
         """Get logs for a container."""
         try:
-            container = await asyncio.to_thread(self.client.containers.get, container_id)
-            logs = await asyncio.to_thread(container.logs, tail=tail)
-            return logs.decode("utf-8")
+            return await self._run(self._read_logs, container_id, tail)
         except APIError as e:
-            logger.error(f"Error fetching logs for container {container_id}: {e}")
+            logger.error("Error fetching logs for container %s: %s", container_id, e)
             raise Exception(f"Error fetching logs for container {container_id}: {e}")
 
-    async def get_images(self) -> List[Dict[str, Any]]:
+    def _read_logs(self, container_id: str, tail: int) -> str:
+        """Stream a container's logs and decode them chunk by chunk."""
+        # Incremental decoder keeps multi-byte characters split across chunks intact
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        chunks = [
+            decoder.decode(chunk)
+            for chunk in self.client.api.logs(container_id, tail=tail, stream=True, follow=False)
+        ]
+        chunks.append(decoder.decode(b"", final=True))
+        return "".join(chunks)
+
+    def _table_rows(self, key: str, data: List[Any], row_key: str, fields: Tuple[str, ...]) -> List[TableRow]:
+        """Convert rows to (row key, cells), reusing them while the cached list is unchanged."""
+        cached = self._table_rows_cache.get(key)
+        if cached and cached[0] is data and cached[1] == fields:
+            return cached[2]
+        key_of, cells = attrgetter(row_key), attrgetter(*fields)
+        rows = [(key_of(item), cells(item)) for item in data]
+        self._table_rows_cache[key] = (data, fields, rows)
+        return rows
+
+    async def get_containers_rows(self, fields: Tuple[str, ...]) -> List[TableRow]:
+        """Get containers as (id, cells), with cells taken from ContainerRow fields in order."""
+        return self._table_rows("containers", await self.get_containers(), "id", fields)
+
+    async def get_images_rows(self, fields: Tuple[str, ...]) -> List[TableRow]:
+        """Get images as (id, cells), with cells taken from ImageRow fields in order."""
+        return self._table_rows("images", await self.get_images(), "id", fields)
+
+    async def get_volumes_rows(self, fields: Tuple[str, ...]) -> List[TableRow]:
+        """Get volumes as (name, cells), with cells taken from VolumeRow fields in order."""
+        return self._table_rows("volumes", await self.get_volumes(), "name", fields)
+
+    async def get_networks_rows(self, fields: Tuple[str, ...]) -> List[TableRow]:
+        """Get networks as (id, cells), with cells taken from NetworkRow fields in order."""
+        return self._table_rows("networks", await self.get_networks(), "id", fields)
+
+    async def get_images(self) -> List[ImageRow]:
         """Get list of Docker images."""
-        current_time = time.time()
-        if current_time - self._cache["images"]["last_update"] < self._cache_duration:
-            logger.debug("Returning cached images")
-            return self._cache["images"]["data"]
+        return await self._cached("images", self._list_images, self._image_row)
 
-        try:
-            images = await asyncio.to_thread(self.client.images.list)
-            self._cache["images"]["data"] = [
-                {
-                    "id": img.id[:12],
-                    "tags": img.tags if img.tags else ["<none>"],
-                    "size": round(img.attrs["Size"] / (1024 * 1024), 2),  # MB
-                    "created": self._format_datetime(img.attrs["Created"])
-                }
-                for img in images
-            ]
-            self._cache["images"]["last_update"] = current_time
-            logger.debug(f"Fetched {len(images)} images")
-            return self._cache["images"]["data"]
-        except APIError as e:
-            logger.error(f"Error fetching images: {e}")
-            raise Exception(f"Error fetching images: {e}")
+    def _list_images(self) -> List[Dict[str, Any]]:
+        """List raw images and refresh the image id -> first tag map. Blocking."""
+        # Raw listing; images.list() would inspect every image
+        images = self.client.api.images()
+        self._image_tags = {
+            img["Id"]: tags[0] if (tags := self._image_tags_of(img)) else "unknown" for img in images
+        }
+        return images
+
+    def _image_tags_of(self, img: Dict[str, Any]) -> List[str]:
+        """Get an image's tags, without the placeholder dangling images report."""
+        return [tag for tag in img.get("RepoTags") or [] if tag != "<none>:<none>"]
+
+    def _image_row(self, img: Dict[str, Any]) -> ImageRow:
+        """Build an image row."""
+        return ImageRow(
+            id=img["Id"].removeprefix("sha256:")[:12],
+            tags=", ".join(self._image_tags_of(img)) or "<none>",
+            size=str(round(img["Size"] * _INV_MIB, 2)),  # MB
+            created=self._format_timestamp(img["Created"])
+        )
 
     async def remove_image(self, image_id: str, force: bool = False) -> None:
         """Remove a Docker image by ID."""
         try:
-            await asyncio.to_thread(self.client.images.remove, image_id, force=force)
-            self._cache["images"]["last_update"] = 0  # Invalidate cache
-            logger.debug(f"Removed image {image_id}")
+            await self._run(self.client.images.remove, image_id, force=force)
+            self._invalidate("images")
+            logger.debug("Removed image %s", image_id)
         except APIError as e:
-            logger.error(f"Error removing image {image_id}: {e}")
+            logger.error("Error removing image %s: %s", image_id, e)
             raise Exception(f"Error removing image {image_id}: {e}")
 
-    async def get_volumes(self) -> List[Dict[str, Any]]:
+    async def get_volumes(self) -> List[VolumeRow]:
         """Get list of Docker volumes."""
-        current_time = time.time()
-        if current_time - self._cache["volumes"]["last_update"] < self._cache_duration:
-            logger.debug("Returning cached volumes")
-            return self._cache["volumes"]["data"]
+        return await self._cached("volumes", self.client.volumes.list, self._volume_row)
 
-        try:
-            volumes = await asyncio.to_thread(self.client.volumes.list)
-            self._cache["volumes"]["data"] = [
-                {
-                    "name": vol.name,
-                    "driver": vol.attrs["Driver"],
-                    "mountpoint": vol.attrs["Mountpoint"],
-                    "created": vol.attrs.get("CreatedAt", "Unknown")
-                }
-                for vol in volumes
-            ]
-            self._cache["volumes"]["last_update"] = current_time
-            logger.debug(f"Fetched {len(volumes)} volumes")
-            return self._cache["volumes"]["data"]
-        except APIError as e:
-            logger.error(f"Error fetching volumes: {e}")
-            raise Exception(f"Error fetching volumes: {e}")
+    def _volume_row(self, vol) -> VolumeRow:
+        """Build a volume row."""
+        return VolumeRow(
+            name=vol.name,
+            driver=vol.attrs["Driver"],
+            mountpoint=vol.attrs["Mountpoint"],
+            created=self._format_datetime(vol.attrs.get("CreatedAt", "Unknown"))
+        )
 
     async def remove_volume(self, volume_name: str) -> None:
         """Remove a Docker volume by name."""
         try:
-            volume = await asyncio.to_thread(self.client.volumes.get, volume_name)
-            await asyncio.to_thread(volume.remove)
-            self._cache["volumes"]["last_update"] = 0  # Invalidate cache
-            logger.debug(f"Removed volume {volume_name}")
+            await self._run(self.client.api.remove_volume, volume_name)
+            self._invalidate("volumes")
+            logger.debug("Removed volume %s", volume_name)
         except APIError as e:
-            logger.error(f"Error removing volume {volume_name}: {e}")
+            logger.error("Error removing volume %s: %s", volume_name, e)
             raise Exception(f"Error removing volume {volume_name}: {e}")
 
-    async def get_networks(self) -> List[Dict[str, Any]]:
+    async def get_networks(self) -> List[NetworkRow]:
         """Get list of Docker networks."""
-        current_time = time.time()
-        if current_time - self._cache["networks"]["last_update"] < self._cache_duration:
-            logger.debug("Returning cached networks")
-            return self._cache["networks"]["data"]
+        return await self._cached("networks", self.client.networks.list, self._network_row)
 
-        try:
-            networks = await asyncio.to_thread(self.client.networks.list)
-            self._cache["networks"]["data"] = [
-                {
-                    "id": net.id[:12],
-                    "name": net.name,
-                    "driver": net.attrs["Driver"],
-                    "created": net.attrs.get("Created", "Unknown")
-                }
-                for net in networks
-            ]
-            self._cache["networks"]["last_update"] = current_time
-            logger.debug(f"Fetched {len(networks)} networks")
-            return self._cache["networks"]["data"]
-        except APIError as e:
-            logger.error(f"Error fetching networks: {e}")
-            raise Exception(f"Error fetching networks: {e}")
+    def _network_row(self, net) -> NetworkRow:
+        """Build a network row."""
+        return NetworkRow(
+            id=net.id[:12],
+            name=net.name,
+            driver=net.attrs["Driver"],
+            created=self._format_datetime(net.attrs.get("Created", "Unknown"))
+        )
 
     async def remove_network(self, network_id: str) -> None:
         """Remove a Docker network by ID."""
         try:
-            network = await asyncio.to_thread(self.client.networks.get, network_id)
-            await asyncio.to_thread(network.remove)
-            self._cache["networks"]["last_update"] = 0  # Invalidate cache
-            logger.debug(f"Removed network {network_id}")
+            await self._run(self.client.api.remove_network, network_id)
+            self._invalidate("networks")
+            logger.debug("Removed network %s", network_id)
         except APIError as e:
-            logger.error(f"Error removing network {network_id}: {e}")
+            logger.error("Error removing network %s: %s", network_id, e)
             raise Exception(f"Error removing network {network_id}: {e}")
\ No newline at end of file
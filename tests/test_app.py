@@ -0,0 +1,87 @@
+import asyncio
+
+from textual.widgets import DataTable
+
+from tui import app as tui_app
+from tui.app import DockManApp
+
+CONTAINERS = [
+    ("aaa", ("web", "running", "0.5", "12.0", "80/tcp", "2024-03-05 07:08:09")),
+    ("bbb", ("db", "exited", "0.0", "0.0", "", "2024-03-05 07:08:10")),
+]
+
+
+class FakeClient:
+    """Serves fixed table rows; Docker events never arrive."""
+
+    def __init__(self):
+        self.rows = {"containers": CONTAINERS, "images": [], "volumes": [], "networks": []}
+
+    async def get_containers_rows(self, fields):
+        return self.rows["containers"]
+
+    async def get_images_rows(self, fields):
+        return self.rows["images"]
+
+    async def get_volumes_rows(self, fields):
+        return self.rows["volumes"]
+
+    async def get_networks_rows(self, fields):
+        return self.rows["networks"]
+
+    async def events(self):
+        await asyncio.Event().wait()
+        yield set()
+
+    async def aclose(self):
+        pass
+
+
+def table_rows(table: DataTable):
+    return {key.value: tuple(table.get_row(key)) for key in table.rows}
+
+
+def test_patch_table_applies_row_changes_in_place(monkeypatch):
+    monkeypatch.setattr(tui_app, "DockerClient", FakeClient)
+
+    async def run():
+        app = DockManApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            table = app.tables["containers"]
+            assert table_rows(table) == dict(CONTAINERS)
+
+            app._data["containers"] = [
+                ("aaa", ("web", "restarting", "123.45", "12.0", "8080:80/tcp, 8443:443/tcp", "2024-03-05 07:08:09")),
+                ("ccc", ("cache", "running", "1.0", "3.0", "", "2024-03-05 07:08:11")),
+            ]
+            app._render_tab("containers")
+            await pilot.pause()
+
+            assert app.tables["containers"] is table  # Patched, not rebuilt
+            assert table_rows(table) == dict(app._data["containers"])
+            # Widths follow patched cells, so longer values aren't clipped
+            widths = [column.content_width for column in table.ordered_columns]
+            assert widths[1] >= len("restarting")
+            assert widths[4] >= len("8080:80/tcp, 8443:443/tcp")
+
+    asyncio.run(run())
+
+
+def test_empty_listing_shows_message(monkeypatch):
+    monkeypatch.setattr(tui_app, "DockerClient", FakeClient)
+
+    async def run():
+        app = DockManApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app._data["containers"] = []
+            app._render_tab("containers")
+            await pilot.pause()
+
+            assert "containers" not in app.tables
+            message = app.query_one("#containers").query_one(DataTable)
+            assert message.row_count == 1
+            assert message.get_row_at(0) == ["No containers found"]
+
+    asyncio.run(run())
@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core import docker_client
+from core.docker_client import DockerClient, _format_iso_datetime
+
+
+class FakeEvents:
+    """An events stream that stays silent until closed."""
+
+    def __init__(self):
+        self._closed = threading.Event()
+
+    def __iter__(self):
+        self._closed.wait()
+        return iter(())
+
+    def close(self):
+        self._closed.set()
+
+
+class FakeDocker:
+    """The parts of docker.DockerClient the client touches outside the methods under test."""
+
+    def events(self, decode=True, filters=None):
+        return FakeEvents()
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(docker_client.os.path, "exists", lambda path: True)
+        m.setattr(docker_client.os, "access", lambda path, mode: True)
+        m.setattr(docker_client.docker, "from_env", lambda **kwargs: FakeDocker())
+        client = DockerClient()
+    yield client
+    asyncio.run(client.aclose())
+
+
+def counting_fetch(results, delay=0.0):
+    """A blocking fetch returning successive results, with a call counter."""
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(delay)
+        return results[min(len(calls), len(results)) - 1]
+
+    return fetch, calls
+
+
+def test_cached_fetches_once_for_concurrent_callers(client):
+    fetch, calls = counting_fetch([["bridge", "host"]], delay=0.05)
+
+    async def read_three():
+        return await asyncio.gather(*(client._cached("networks", fetch, str.upper) for _ in range(3)))
+
+    first, second, third = asyncio.run(read_three())
+
+    assert calls == [1]
+    assert first == ["BRIDGE", "HOST"]
+    assert first is second is third
+
+
+def test_cached_serves_fresh_bucket_without_fetching(client):
+    fetch, calls = counting_fetch([["bridge"]])
+
+    async def read_twice():
+        await client._cached("networks", fetch, str.upper)
+        return await client._cached("networks", fetch, str.upper)
+
+    assert asyncio.run(read_twice()) == ["BRIDGE"]
+    assert calls == [1]
+
+
+def test_cached_keeps_list_identity_for_unchanged_data(client):
+    fetch, calls = counting_fetch([["bridge"], ["bridge"], ["bridge", "host"]])
+
+    async def read_after_invalidation():
+        first = await client._cached("networks", fetch, str.upper)
+        client._invalidate("networks")
+        second = await client._cached("networks", fetch, str.upper)
+        client._invalidate("networks")
+        third = await client._cached("networks", fetch, str.upper)
+        return first, second, third
+
+    first, second, third = asyncio.run(read_after_invalidation())
+
+    assert calls == [1, 1, 1]
+    assert second is first
+    assert third == ["BRIDGE", "HOST"]
+
+
+def test_invalidation_during_fetch_leaves_bucket_stale(client):
+    client._events_active = True  # Longest TTL, where a lost invalidation hurts most
+    fetching, release = threading.Event(), threading.Event()
+    results = iter([["bridge"], ["bridge", "host"]])
+
+    def fetch():
+        fetching.set()
+        release.wait(5)
+        return next(results)
+
+    async def invalidate_mid_fetch():
+        read = asyncio.ensure_future(client._cached("networks", fetch, str.upper))
+        await asyncio.get_running_loop().run_in_executor(None, fetching.wait, 5)
+        client._invalidate("networks")  # As _watch_events would on a network event
+        release.set()
+        stale = await read
+        assert not client._is_fresh("networks", time.time())
+        return stale, await client._cached("networks", fetch, str.upper)
+
+    stale, current = asyncio.run(invalidate_mid_fetch())
+
+    assert stale == ["BRIDGE"]
+    assert current == ["BRIDGE", "HOST"]
+
+
+def test_read_cgroup_stats(client, tmp_path, monkeypatch):
+    cgroup = tmp_path / "abc"
+    cgroup.mkdir()
+    (cgroup / "cpu.stat").write_bytes(b"usage_usec 1000000\nuser_usec 600000\nsystem_usec 400000\n")
+    (cgroup / "memory.current").write_bytes(b"268435456\n")
+    (cgroup / "memory.max").write_bytes(b"1073741824\n")
+    monkeypatch.setattr(docker_client, "_CGROUP_PATTERNS", (str(tmp_path / "{}"),))
+    client._cpu_count = 2
+
+    assert client._read_cgroup_stats("abc", now=10.0)
+    assert client._stats_latest["abc"] == {"cpu": 0.0, "memory": 256.0, "memory_percent": 25.0}
+
+    # One second of CPU time over one second on two cores is half the host
+    (cgroup / "cpu.stat").write_bytes(b"usage_usec 2000000\n")
+    (cgroup / "memory.max").write_bytes(b"max\n")
+    client._host_memory = 4 * 1073741824
+    assert client._read_cgroup_stats("abc", now=11.0)
+    assert client._stats_latest["abc"] == {"cpu": 50.0, "memory": 256.0, "memory_percent": 6.25}
+
+
+def test_read_cgroup_stats_without_cgroup(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(docker_client, "_CGROUP_PATTERNS", (str(tmp_path / "{}"),))
+
+    assert not client._read_cgroup_stats("missing", now=10.0)
+    assert "missing" not in client._stats_latest
+
+
+def test_format_ports_ignores_daemon_order(client):
+    ports = [
+        {"PrivatePort": 443, "PublicPort": 8443, "Type": "tcp"},
+        {"PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"},
+        {"PrivatePort": 53, "Type": "udp"},
+    ]
+
+    assert client._format_ports(ports) == "53/udp, 8080:80/tcp, 8443:443/tcp"
+    assert client._format_ports(ports[::-1]) == client._format_ports(ports)
+    assert client._format_ports([]) == ""
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024-03-05T07:08:09.123456789Z", "2024-03-05 07:08:09"),  # Docker's layout, sliced
+    ("2024-03-05T07:08:09+02:00", "2024-03-05 07:08:09"),
+    ("2024-03-05 07:08:09", "2024-03-05 07:08:09"),  # Not "T"-separated: parsed
+    ("2024-03-05", "2024-03-05 00:00:00"),
+    ("Unknown", "Unknown"),
+    ("", "Unknown"),
+    (None, "Unknown"),
+])
+def test_format_iso_datetime(value, expected):
+    assert _format_iso_datetime(value) == expected
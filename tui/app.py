@@ -1,21 +1,65 @@
-import sys
 import os
 import asyncio
 import logging
-
-# Add parent directory to sys.path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Tuple
 
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, DataTable, TabbedContent, TabPane, LoadingIndicator
 from textual.reactive import reactive
-from core.docker_client import DockerClient
+from core.docker_client import DockerClient, TableRow
 
 # Set up logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logging.basicConfig(
+    level=getattr(logging, os.environ.get("DOCKMAN_LOG", "WARNING").upper(), logging.WARNING),
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class TabSpec:
+    """How a tab fetches its rows and which columns it shows."""
+    title: str
+    fetch: Callable[[DockerClient, Tuple[str, ...]], Awaitable[List[TableRow]]]
+    columns: Tuple[Tuple[str, str], ...]  # (header, row attribute) pairs
+
+    @property
+    def headers(self) -> Tuple[str, ...]:
+        return tuple(header for header, _ in self.columns)
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(field for _, field in self.columns)
+
+
+TABS = {
+    "containers": TabSpec(
+        title="Containers",
+        fetch=lambda client, fields: client.get_containers_rows(fields),
+        columns=(
+            ("Name", "name"), ("Status", "status"), ("CPU %", "cpu"),
+            ("Memory MB", "memory"), ("Ports", "ports"), ("Created", "created")
+        )
+    ),
+    "images": TabSpec(
+        title="Images",
+        fetch=lambda client, fields: client.get_images_rows(fields),
+        columns=(("ID", "id"), ("Tags", "tags"), ("Size MB", "size"), ("Created", "created"))
+    ),
+    "volumes": TabSpec(
+        title="Volumes",
+        fetch=lambda client, fields: client.get_volumes_rows(fields),
+        columns=(("Name", "name"), ("Driver", "driver"), ("Mountpoint", "mountpoint"), ("Created", "created"))
+    ),
+    "networks": TabSpec(
+        title="Networks",
+        fetch=lambda client, fields: client.get_networks_rows(fields),
+        columns=(("ID", "id"), ("Name", "name"), ("Driver", "driver"), ("Created", "created"))
+    ),
+}
+
+
 class DockManApp(App):
     """Textual-based TUI for managing Docker containers."""
 
@@ -42,18 +86,30 @@ class DockManApp(App):
         ("t", "switch_tab", "Switch Tab"),
     ]
 
-    active_tab = reactive("containers")
+    active_tab = reactive("containers", init=False)
 
     def __init__(self):
         super().__init__()
         self.docker_client = None
-        self.tables = {}  # Cache tables for each tab
+        self.tables = {}  # Cache tables for each tab; dropped when a message replaces them
+        self._tab_widget = {}  # TabPane of each tab, looked up once on mount
+        self._tab_message = {}  # Message currently shown instead of a tab's table
+        self._tab_sig = {}  # Hash of the rows last rendered in each tab
+        self._data = {}  # Latest fetched rows (or fetch error) for each tab
+        self._row_keys = {}  # Rendered rows of each table by row key, for diffing
+        self._column_keys = {}
         self.is_loading = True
-        self.tab_ids = ["containers", "images", "volumes", "networks"]
+        self.tab_ids = list(TABS)
+        self._next_tab = dict(zip(self.tab_ids, self.tab_ids[1:] + self.tab_ids[:1]))
+        self._events_worker = None
+        self._timer = None
+        self._stats_timer = None
+        self._paused = False  # No refreshes while the terminal is unfocused
 
     async def on_mount(self) -> None:
         """Initialize the app after mounting."""
         logger.debug("Mounting TUI application")
+        self._tab_widget = {tab_id: self.query_one(f"#{tab_id}", TabPane) for tab_id in self.tab_ids}
         # Show loading indicator
         self.query_one(TabbedContent).mount(LoadingIndicator())
         try:
@@ -62,200 +118,202 @@ class DockManApp(App):
             logger.debug("Docker client initialized")
         except Exception as e:
             self.notify(f"Failed to connect to Docker: {e}", severity="error")
-            logger.error(f"Failed to connect to Docker: {e}")
+            logger.error("Failed to connect to Docker: %s", e)
 
         # Initialize tab content
-        await self.update_tab_content("containers")
+        self.is_loading = False
+        await self.update_active_tab()
         # Remove loading indicator
         for widget in self.query_one(TabbedContent).query(LoadingIndicator):
             widget.remove()
-        self.is_loading = False
         logger.debug("TUI initialization complete")
-        # Start periodic update
-        self.set_interval(5.0, self.update_active_tab)
+        if self.docker_client:
+            # Refresh on Docker events; only live container stats still need polling
+            self._events_worker = self.run_worker(self._events_task())
+            self._stats_timer = self.set_interval(5.0, self.update_stats)
+        # Safety net in case an event is missed
+        self._timer = self.set_interval(60.0, self.update_active_tab)
+
+    async def on_unmount(self) -> None:
+        """Release the Docker client when the app shuts down."""
+        if self._events_worker:
+            self._events_worker.cancel()
+        if self.docker_client:
+            await self.docker_client.aclose()
+            logger.debug("Docker client closed")
+
+    def on_app_blur(self) -> None:
+        """Stop refreshing while nobody is looking at the terminal."""
+        self._paused = True
+        for timer in (self._timer, self._stats_timer):
+            if timer:
+                timer.pause()
+        logger.debug("App blurred, refresh paused")
+
+    async def on_app_focus(self) -> None:
+        """Resume refreshing, starting with an immediate update."""
+        if not self._paused:
+            return
+        self._paused = False
+        for timer in (self._timer, self._stats_timer):
+            if timer:
+                timer.resume()
+        logger.debug("App focused, refresh resumed")
+        await self.update_active_tab()
 
     def compose(self) -> ComposeResult:
         """Create the UI layout."""
         yield Header(show_clock=True)
         with TabbedContent():
-            yield TabPane("Containers", id="containers")
-            yield TabPane("Images", id="images")
-            yield TabPane("Volumes", id="volumes")
-            yield TabPane("Networks", id="networks")
+            for tab_id, spec in TABS.items():
+                yield TabPane(spec.title, id=tab_id)
         yield Footer()
 
+    async def _events_task(self) -> None:
+        """Refresh the active tab whenever Docker reports a change to its resources."""
+        async for tab_ids in self.docker_client.events():
+            if self._paused:
+                continue  # The client cache is invalidated anyway; focus triggers a refresh
+            # Keep background tabs current too, so switching to them needs no fetch
+            await self._refresh_all()
+            if self.active_tab in tab_ids:
+                logger.debug("Docker events for %s, refreshing", ", ".join(tab_ids))
+                await self.update_tab_content(self.active_tab)
+
+    async def update_stats(self) -> None:
+        """Refresh live CPU and memory figures while the Containers tab is shown."""
+        if self.active_tab == "containers":
+            await self.update_active_tab()
+
     async def update_active_tab(self) -> None:
-        """Update content for the active tab."""
+        """Refresh tab data and update content for the active tab."""
+        await self._refresh_all()
         await self.update_tab_content(self.active_tab)
 
+    async def _refresh_all(self) -> None:
+        """Fetch data for all tabs concurrently; unchanged ones are client cache hits."""
+        if not self.docker_client:
+            return
+        results = await asyncio.gather(
+            *(spec.fetch(self.docker_client, spec.fields) for spec in TABS.values()),
+            return_exceptions=True
+        )
+        self._data.update(zip(TABS, results))
+
     async def update_tab_content(self, tab_id: str) -> None:
         """Update content for a specific tab."""
         if self.is_loading:
-            logger.debug(f"Skipping update for {tab_id} due to loading state")
+            logger.debug("Skipping update for %s due to loading state", tab_id)
             return
 
         if not self.docker_client:
             self.mount_error_table(tab_id, "Failed to connect to Docker")
-            logger.error(f"No Docker client for {tab_id}")
+            logger.error("No Docker client for %s", tab_id)
             return
 
         try:
-            if tab_id == "containers":
-                await self.update_containers_tab()
-            elif tab_id == "images":
-                await self.update_images_tab()
-            elif tab_id == "volumes":
-                await self.update_volumes_tab()
-            elif tab_id == "networks":
-                await self.update_networks_tab()
+            data = self._data.get(tab_id)
+            if isinstance(data, Exception):
+                raise data
+            self._render_tab(tab_id)
         except Exception as e:
             self.mount_error_table(tab_id, f"Error: {e}")
             self.notify(f"Error updating {tab_id}: {e}", severity="error")
-            logger.error(f"Error updating {tab_id}: {e}")
-
-    async def update_containers_tab(self) -> None:
-        """Update the Containers tab."""
-        logger.debug("Updating containers tab")
-        tab = self.query_one("#containers", TabPane)
-        containers = await self.docker_client.get_containers(all=True)
-        logger.debug(f"Received {len(containers)} containers: {containers}")
-
-        if not containers:
-            self.mount_error_table("containers", "No containers found")
-            logger.debug("No containers found")
+            logger.error("Error updating %s: %s", tab_id, e)
+
+    def _render_tab(self, tab_id: str) -> None:
+        """Render a tab's latest data into its DataTable."""
+        spec = TABS[tab_id]
+        logger.debug("Updating %s tab", tab_id)
+        items = self._data.get(tab_id, [])
+        logger.debug("Received %d %s", len(items), tab_id)
+
+        if not items:
+            self.mount_error_table(tab_id, f"No {tab_id} found")
+            logger.debug("No %s found", tab_id)
             return
 
-        if "containers" not in self.tables:
-            tab.mount(DataTable())
-            self.tables["containers"] = tab.query_one(DataTable)
-            self.tables["containers"].add_columns("Name", "Status", "CPU %", "Memory MB", "Ports", "Created")
-            logger.debug("Created containers table")
-
-        table = self.tables["containers"]
-        table.clear()
-        for c in containers:
-            table.add_row(
-                c["name"],
-                c["status"],
-                str(c["cpu"]),
-                str(c["memory"]),
-                c["ports"],
-                c["created"]
-            )
-        logger.debug("Containers table updated")
-
-    async def update_images_tab(self) -> None:
-        """Update the Images tab."""
-        logger.debug("Updating images tab")
-        tab = self.query_one("#images", TabPane)
-        images = await self.docker_client.get_images()
-
-        if not images:
-            self.mount_error_table("images", "No images found")
-            logger.debug("No images found")
+        rows = dict(items)
+        sig = hash(tuple(rows.items()))
+        if self._tab_sig.get(tab_id) == sig:
+            logger.debug("%s unchanged, skipping redraw", spec.title)
             return
 
-        if "images" not in self.tables:
-            tab.mount(DataTable())
-            self.tables["images"] = tab.query_one(DataTable)
-            self.tables["images"].add_columns("ID", "Tags", "Size MB", "Created")
-            logger.debug("Created images table")
-
-        table = self.tables["images"]
-        table.clear()
-        for img in images:
-            table.add_row(
-                img["id"],
-                ", ".join(img["tags"]),
-                str(img["size"]),
-                img["created"]
-            )
-        logger.debug("Images table updated")
-
-    async def update_volumes_tab(self) -> None:
-        """Update the Volumes tab."""
-        logger.debug("Updating volumes tab")
-        tab = self.query_one("#volumes", TabPane)
-        volumes = await self.docker_client.get_volumes()
-
-        if not volumes:
-            self.mount_error_table("volumes", "No volumes found")
-            logger.debug("No volumes found")
-            return
-
-        if "volumes" not in self.tables:
-            tab.mount(DataTable())
-            self.tables["volumes"] = tab.query_one(DataTable)
-            self.tables["volumes"].add_columns("Name", "Driver", "Mountpoint", "Created")
-            logger.debug("Created volumes table")
-
-        table = self.tables["volumes"]
-        table.clear()
-        for vol in volumes:
-            table.add_row(
-                vol["name"],
-                vol["driver"],
-                vol["mountpoint"],
-                vol["created"]
-            )
-        logger.debug("Volumes table updated")
-
-    async def update_networks_tab(self) -> None:
-        """Update the Networks tab."""
-        logger.debug("Updating networks tab")
-        tab = self.query_one("#networks", TabPane)
-        networks = await self.docker_client.get_networks()
-
-        if not networks:
-            self.mount_error_table("networks", "No networks found")
-            logger.debug("No networks found")
-            return
-
-        if "networks" not in self.tables:
-            tab.mount(DataTable())
-            self.tables["networks"] = tab.query_one(DataTable)
-            self.tables["networks"].add_columns("ID", "Name", "Driver", "Created")
-            logger.debug("Created networks table")
-
-        table = self.tables["networks"]
-        table.clear()
-        for net in networks:
-            table.add_row(
-                net["id"],
-                net["name"],
-                net["driver"],
-                net["created"]
-            )
-        logger.debug("Networks table updated")
+        if tab_id not in self.tables:
+            tab = self._tab_widget[tab_id]
+            tab.remove_children()  # Drop any message table
+            self._tab_message.pop(tab_id, None)
+            table = DataTable()
+            self._column_keys[tab_id] = table.add_columns(*spec.headers)
+            tab.mount(table)
+            self.tables[tab_id] = table
+            self._fill_table(tab_id, rows)
+            logger.debug("Created %s table", tab_id)
+        else:
+            self._patch_table(tab_id, rows)
+        self._tab_sig[tab_id] = sig
+        logger.debug("%s table updated", spec.title)
+
+    def _fill_table(self, tab_id: str, rows: Dict[str, Tuple[str, ...]]) -> None:
+        """Load every row into a freshly created table; there is nothing to diff against yet."""
+        table = self.tables[tab_id]
+        for key, row in rows.items():
+            table.add_row(*row, key=key)  # add_rows() can't take row keys, which diffing needs
+        self._row_keys[tab_id] = rows
+
+    def _patch_table(self, tab_id: str, rows: Dict[str, Tuple[str, ...]]) -> None:
+        """Apply only the rows added, removed or changed since the last render."""
+        table = self.tables[tab_id]
+        rendered = self._row_keys[tab_id]
+        for key in rendered.keys() - rows.keys():
+            table.remove_row(key)
+            del rendered[key]
+        for key, row in rows.items():
+            previous = rendered.get(key)
+            if previous is None:
+                table.add_row(*row, key=key)
+            elif previous != row:
+                for column, value, old_value in zip(self._column_keys[tab_id], row, previous):
+                    if value != old_value:
+                        table.update_cell(key, column, value, update_width=True)
+            rendered[key] = row
 
     def mount_error_table(self, tab_id: str, message: str) -> None:
         """Mount a table with an error or no-data message."""
-        logger.debug(f"Mounting error table for {tab_id}: {message}")
-        tab = self.query_one(f"#{tab_id}", TabPane)
-        for widget in tab.query():
-            widget.remove()
-        tab.mount(DataTable(classes="no-data"))
-        table = tab.query_one(DataTable)
+        if self._tab_message.get(tab_id) == message:
+            return  # Already shown
+        logger.debug("Mounting error table for %s: %s", tab_id, message)
+        tab = self._tab_widget[tab_id]
+        self.tables.pop(tab_id, None)
+        self._tab_sig.pop(tab_id, None)
+        self._row_keys.pop(tab_id, None)
+        tab.remove_children()
+        table = DataTable(classes="no-data")
         table.add_column("Message")
         table.add_row(message)
+        tab.mount(table)
+        self._tab_message[tab_id] = message
 
     def action_switch_tab(self) -> None:
         """Switch to the next tab."""
-        logger.debug("Switching tab")
-        tabbed_content = self.query_one(TabbedContent)
-        current_tab = tabbed_content.active
-        if current_tab:
-            current_index = self.tab_ids.index(current_tab)
-            next_index = (current_index + 1) % len(self.tab_ids)
-            next_tab = self.tab_ids[next_index]
-            tabbed_content.active = next_tab
-            self.active_tab = next_tab
-            logger.debug(f"Switched to tab {next_tab}")
-            self.run_worker(self.update_tab_content(next_tab))
-        else:
-            logger.warning("No active tab found")
+        next_tab = self._next_tab[self.active_tab]
+        self.query_one(TabbedContent).active = next_tab
+        self.active_tab = next_tab
+        logger.debug("Switched to tab %s", next_tab)
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Keep active_tab in sync when a tab is picked with the mouse."""
+        self.active_tab = event.pane.id
+
+    async def watch_active_tab(self, tab_id: str) -> None:
+        """Show the newly active tab's data; it was fetched with the other tabs."""
+        await self.update_tab_content(tab_id)
+
+
+def main() -> None:
+    """Run the DockMan TUI."""
+    DockManApp().run()
 
 
 if __name__ == "__main__":
-    app = DockManApp()
-    app.run()
\ No newline at end of file
+    main()
\ No newline at end of file